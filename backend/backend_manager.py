@@ -1,7 +1,25 @@
 
 from typing import Dict, Any
-import json
 from datetime import datetime
+import logging
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Sérialise en JSON indenté via orjson (implémentation C)"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> str:
+        """Sérialise en JSON indenté via la bibliothèque standard"""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+logger = logging.getLogger(__name__)
+
+_REQUIRED_FIELDS = frozenset(('subjects', 'deadlines', 'available_time'))
 
 
 class BackendManager:
@@ -11,7 +29,7 @@ class BackendManager:
         """Initialise le gestionnaire backend"""
         self.llm_engine = None  # Person A le remplira
         self.planner_logic = None  # Person B le remplira
-        print("✅ BackendManager initialisé")
+        logger.debug("BackendManager initialisé")
     
     def process_request(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -26,19 +44,19 @@ class BackendManager:
         try:
             # Étape 1 : Valider
             validated_data = self._validate_input(user_input)
-            print("✓ Validation OK")
+            logger.debug("Validation OK")
             
             # Étape 2 : IA
             ai_analysis = self._get_ai_analysis(validated_data)
-            print("✓ Analyse IA OK")
+            logger.debug("Analyse IA OK")
             
             # Étape 3 : Planning
             study_plan = self._generate_study_plan(validated_data)
-            print("✓ Planning OK")
+            logger.debug("Planning OK")
             
             # Étape 4 : Combiner
             final_response = self._combine_results(ai_analysis, study_plan)
-            print("✓ Résultats combinés OK")
+            logger.debug("Résultats combinés OK")
             
             return final_response
             
@@ -47,11 +65,9 @@ class BackendManager:
     
     def _validate_input(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
         """Valide les données utilisateur"""
-        required = ['subjects', 'deadlines', 'available_time']
-        
-        for field in required:
-            if field not in user_input:
-                raise ValueError(f"Champ manquant : {field}")
+        missing = _REQUIRED_FIELDS - user_input.keys()
+        if missing:
+            raise ValueError(f"Champ(s) manquant(s) : {', '.join(sorted(missing))}")
         
         return user_input
     
@@ -78,7 +94,7 @@ class BackendManager:
             "success": True,
             "ai_insights": ai_analysis,
             "study_plan": study_plan,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat(timespec="seconds")
         }
     
     def _handle_error(self, error: Exception) -> Dict[str, Any]:
@@ -96,6 +112,7 @@ def create_backend_manager():
 
 # TEST
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="✓ %(message)s")
     print("🧪 TEST DU BACKEND\n")
     
     manager = create_backend_manager()
@@ -110,4 +127,4 @@ if __name__ == "__main__":
     result = manager.process_request(test_input)
     
     print("\n📊 Résultat :")
-    print(json.dumps(result, indent=2, ensure_ascii=False))
\ No newline at end of file
+    print(_dumps(result))
\ No newline at end of file